@@ -4,7 +4,7 @@ requirements = ["requests>=2.22.0"]
 
 setup_requirements = ["pytest-runner", "setuptools>=38.6.0", "wheel>=0.31.0"]
 
-test_requirements = ["pytest", "responses"]
+test_requirements = ["pytest", "responses", "httpx", "requests-cache"]
 
 with open("README.md") as infile:
     long_description = infile.read()
@@ -34,6 +34,10 @@ setup(
     package_dir={"": "src"},
     entry_points={"console_scripts": ["bcr-authenticate = bcr_api.authenticate:main"]},
     install_requires=requirements,
+    extras_require={
+        "async": ["httpx[http2]>=0.16.0"],
+        "cache": ["requests-cache>=0.6.0"],
+    },
     tests_require=test_requirements,
     setup_requires=setup_requirements,
     python_requires=">=3.5",
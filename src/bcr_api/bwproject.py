@@ -2,19 +2,35 @@
 bwproject contains the BWUser and BWProject classes
 """
 
+import asyncio
+import hashlib
+import os
 import requests
+import socket
 import time
 import logging
 import json
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 from .credentials import CredentialsStore
 
+DEFAULT_PROJECT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".bcr", "projects.json"
+)
+
+# Level and handlers are left to the application; enable DEBUG on the
+# "bcr_api" logger to see the url of every request made.
 logger = logging.getLogger("bcr_api")
-handler = logging.StreamHandler()
-formatter = logging.Formatter("%(asctime)s %(levelname)s: %(message)s", "%H:%M:%S")
-handler.setFormatter(formatter)
-logger.addHandler(handler)
-logger.setLevel(logging.DEBUG)
 
 
 class BWUser:
@@ -28,8 +44,16 @@ class BWUser:
         username:   Brandwatch username.
         password:   Brandwatch password.
         token:      Access token.
+        session:    Pooled requests session shared by all calls to the API, so that connections are kept alive between requests.
     """
 
+    # Project listings shared across instances, keyed by lowercase username, so
+    # constructing several objects for the same user costs one /projects call.
+    _projects_cache = {}
+
+    # API hosts whose DNS warm-up has already been attempted this process.
+    _resolved_hosts = set()
+
     def __init__(
         self,
         token=None,
@@ -40,6 +64,7 @@ class BWUser:
         client_id="brandwatch-api-client",
         client_secret=None,
         apiurl="https://api.brandwatch.com/",
+        cache_responses=False,
     ):
         """
         Creates a BWUser object.
@@ -49,9 +74,17 @@ class BWUser:
             password:   Brandwatch password - Optional if you already have an access token.
             token:      Access token - Optional.
             token_path:  File path to the file where access tokens will be read from and written to - Optional.  Defaults to tokens.txt, pass None to disable.
+            cache_responses:  Cache idempotent GET responses on disk, honouring the server's cache headers - Optional.  Requires the requests-cache package.
         """
         self.apiurl = apiurl
         self.oauthpath = "oauth/token"
+        self._preresolve(apiurl)
+        self.session = self._build_session(False)
+        self._aclient = None
+        self._aclient_loop = None
+        self._inflight = {}
+        self._projects = None
+        self._validation_cache = {}
         self.credentials_store = CredentialsStore(credentials_path=token_path)
         if token:
             self.username, self.token = self._test_auth(username, token)
@@ -69,12 +102,75 @@ class BWUser:
             raise KeyError(
                 "Must provide valid token, username and password, or username and path to token file"
             )
+        if cache_responses:
+            # The response cache is scoped per access token, so it can only
+            # be built once authentication has resolved one.
+            self.session = self._build_session(True, token=self.token)
+        self.session.headers["Authorization"] = "Bearer {}".format(self.token)
+
+    @classmethod
+    def _preresolve(cls, apiurl):
+        """
+        Warms the resolver cache for the API host, once per host per process, so the first request doesn't pay a DNS round-trip on top of the TLS handshake.
+        Failures are ignored - the request itself will surface any real connectivity problem.
+        """
+        parsed = urlsplit(apiurl)
+        if not parsed.hostname or parsed.hostname in cls._resolved_hosts:
+            return
+        # Record the attempt whether or not it succeeds - offline, every
+        # construction would otherwise block on the full resolver timeout.
+        cls._resolved_hosts.add(parsed.hostname)
+        try:
+            socket.getaddrinfo(parsed.hostname, parsed.port or 443)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _build_session(cache_responses, token=None, cache_dir=None):
+        """
+        Builds the pooled session used for all API calls, optionally backed by an on-disk response cache scoped to the given access token.
+
+        Raises:
+            ImportError: If cache_responses is set but the optional requests-cache dependency is not installed.
+        """
+        if cache_responses:
+            if requests_cache is None:
+                raise ImportError(
+                    "Response caching requires the requests-cache package - install with: pip install bcr-api[cache]"
+                )
+            if cache_dir is None:
+                cache_dir = os.path.join(os.path.expanduser("~"), ".bcr")
+            os.makedirs(cache_dir, exist_ok=True)
+            # One cache file per access token: requests-cache strips the
+            # Authorization header before cache keys are built, so a store
+            # shared between accounts would serve one account's cached
+            # responses to another.
+            digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+            session = requests_cache.CachedSession(
+                os.path.join(cache_dir, "response_cache_" + digest),
+                backend="sqlite",
+                expire_after=3600,
+                cache_control=True,
+                allowable_methods=("GET",),
+            )
+        else:
+            session = requests.Session()
+        # Retry connection failures only - 429 handling (with its clamped
+        # Retry-After sleep) lives in bare_request, and urllib3 would
+        # otherwise honour the header itself, unbounded.
+        retries = requests.adapters.Retry(total=3, respect_retry_after_header=False)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _test_auth(self, username, token):
 
         headers = {}
         headers["Authorization"] = "Bearer {}".format(token)
-        user = requests.get(self.apiurl + "me", headers=headers).json()
+        user = self.session.get(self.apiurl + "me", headers=headers).json()
 
         if "username" in user:
             if username is None:
@@ -91,7 +187,7 @@ class BWUser:
     def _get_auth(
         self, username, password, token_path, grant_type, client_id, client_secret
     ):
-        token = requests.post(
+        response = self.session.post(
             self.apiurl + self.oauthpath,
             params={
                 "username": username,
@@ -100,29 +196,46 @@ class BWUser:
                 "client_secret": client_secret,
             },
             data={"password": password},
-        ).json()
-        if "access_token" in token:
-            return username, token["access_token"]
-        else:
-            raise KeyError("Authentication failed", token)
+        )
+        try:
+            body = response.json()
+        except ValueError:
+            # e.g. an HTML error page from a proxy rather than the oauth endpoint
+            response.raise_for_status()
+            raise RuntimeError(response.text)
+        token = body.get("access_token")
+        if token:
+            return username, token
+        raise KeyError("Authentication failed", body)
 
-    def get_projects(self):
+    def get_projects(self, refresh=False):
         """
-        Gets a list of projects accessible to the user.
+        Gets a list of projects accessible to the user.  The list is fetched once and reused for the lifetime of the object.
+
+        Args:
+            refresh:    Fetch the list from the API even if a previously fetched copy is available - Optional.
 
         Returns:
             List of dictionaries, where each dictionary is the information (name, id, clientName, timezone, ....) for one project.
         """
-        response = self.request(verb=requests.get, address="projects")
-        return response["results"] if "results" in response else response
+        if refresh or self._projects is None:
+            key = self.username.lower()
+            if refresh or key not in BWUser._projects_cache:
+                response = self.request(verb="GET", address="projects")
+                BWUser._projects_cache[key] = (
+                    response["results"] if "results" in response else response
+                )
+            self._projects = BWUser._projects_cache[key]
+        return self._projects
 
     def get_self(self):
         """ Gets username and id """
-        return self.request(verb=requests.get, address="me")
+        return self.request(verb="GET", address="me")
 
     def validate_query_search(self, **kwargs):
         """
         Checks a query search to see if it contains errors.  Same query debugging as used in the front end.
+        Validation is a pure function of its arguments, so successful results are memoized per object and repeat calls skip the HTTP round-trip.
 
         Keyword Args:
             booleanQuery: Search terms included in the query.
@@ -136,14 +249,17 @@ class BWUser:
         if "language" not in kwargs:
             kwargs["language"] = ["en"]
 
-        valid_search = self.request(
-            verb=requests.post, address="query-validation", data=json.dumps(kwargs)
-        )
-        return valid_search
+        key = ("query-validation", json.dumps(kwargs, sort_keys=True))
+        if key not in self._validation_cache:
+            self._validation_cache[key] = self.request(
+                verb="POST", address="query-validation", data=json.dumps(kwargs)
+            )
+        return self._validation_cache[key]
 
     def validate_rule_search(self, **kwargs):
         """
         Checks a rule search to see if it contains errors.  Same rule debugging as used in the front end.
+        Validation is a pure function of its arguments, so successful results are memoized per object and repeat calls skip the HTTP round-trip.
 
         Keyword Args:
             booleanQuery: Search terms included in the rule.
@@ -157,17 +273,19 @@ class BWUser:
         if "language" not in kwargs:
             kwargs["language"] = ["en"]
 
-        valid_search = self.request(
-            verb=requests.get, address="query-validation/searchwithin", params=kwargs
-        )
-        return valid_search
+        key = ("query-validation/searchwithin", json.dumps(kwargs, sort_keys=True))
+        if key not in self._validation_cache:
+            self._validation_cache[key] = self.request(
+                verb="GET", address="query-validation/searchwithin", params=kwargs
+            )
+        return self._validation_cache[key]
 
-    def request(self, verb, address, params={}, data={}):
+    def request(self, verb, address, params=None, data=None):
         """
         Makes a request to the Brandwatch API.
 
         Args:
-            verb:       Type of request you want to make (e.g. 'requests.get').
+            verb:       HTTP method for the request (e.g. 'GET').
             address:    Address to append to the Brandwatch API url.
             params:     Any additional parameters - Optional.
             data:       Any additional data - Optional.
@@ -179,68 +297,258 @@ class BWUser:
             verb=verb,
             address_root=self.apiurl,
             address_suffix=address,
-            access_token=self.token,
             params=params,
             data=data,
         )
 
-    def bare_request(
-        self, verb, address_root, address_suffix, access_token="", params={}, data={}
-    ):
+    def bare_request(self, verb, address_root, address_suffix, params=None, data=None):
         """
         Makes a request to the Brandwatch API.
 
         Args:
-            verb:           Type of request you want to make (e.g. 'requests.get').
+            verb:           HTTP method for the request (e.g. 'GET').
             address_root:   In most cases this will the the Brandwatch API url, but we leave the flexibility to change this for a different root address if needed.
             address_suffix: Address to append to the root url.
-            access_token:   Access token - Optional.
             params:         Any additional parameters - Optional.
             data:           Any additional data - Optional.
 
         Returns:
             The response json
         """
-        time.sleep(0.5)
-
         headers = {}
 
-        if access_token:
-            headers["Authorization"] = "Bearer {}".format(access_token)
-        if data == {}:
-            response = verb(
-                address_root + address_suffix, params=params, headers=headers
-            )
-        else:
+        if data:
             headers["Content-type"] = "application/json"
-            response = verb(
-                address_root + address_suffix, params=params, data=data, headers=headers
+        else:
+            data = None
+
+        backoff = 1
+        for attempt in range(5):
+            response = self.session.request(
+                verb,
+                address_root + address_suffix,
+                params=params,
+                data=data,
+                headers=headers,
+            )
+            if response.status_code != 429:
+                break
+            try:
+                retry_after = float(response.headers.get("Retry-After", backoff))
+            except ValueError:
+                # Retry-After can also be an HTTP-date; fall back to our own backoff
+                retry_after = backoff
+            # cap the server-supplied delay at the same ceiling as the backoff
+            retry_after = min(retry_after, 30)
+            logger.warning(
+                "Rate limited by the API, retrying in %s seconds", retry_after
             )
+            time.sleep(retry_after)
+            backoff = min(backoff * 2, 30)
+        if response.status_code == 429:
+            # still rate limited after exhausting the retries
+            response.raise_for_status()
 
         try:
-            response.json()
-        except ValueError as e:
-            # handles non-json responses (e.g. HTTP 404, 500, 502, 503, 504)
-            if "Expecting value: line 1 column 1 (char 0)" in str(e):
-                logger.error(
-                    "There was an error with this request: \n{}\n{}\n{}".format(
-                        response.url, data, response.text
-                    )
+            body = response.json()
+        except ValueError:
+            # handles non-json responses (e.g. HTML error pages for HTTP 404, 500, 502, 503, 504)
+            logger.error(
+                "There was an error with this request: \n{}\n{}\n{}".format(
+                    response.url, data, response.text
                 )
-                raise RuntimeError(response.text)
-            else:
-                raise
-        else:
-            if "errors" in response.json() and response.json()["errors"]:
-                logger.error(
-                    "There was an error with this request: \n{}\n{}\n{}".format(
-                        response.url, data, response.json()["errors"]
-                    )
+            )
+            response.raise_for_status()
+            raise RuntimeError(response.text)
+        if "errors" in body and body["errors"]:
+            logger.error(
+                "There was an error with this request: \n{}\n{}\n{}".format(
+                    response.url, data, body["errors"]
+                )
+            )
+            raise RuntimeError(body["errors"])
+
+        logger.debug("%s", response.url)
+        return body
+
+    def _async_client(self):
+        """
+        Lazily creates the shared httpx.AsyncClient used by the async request methods.
+
+        Raises:
+            ImportError: If the optional httpx dependency is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                "The async request methods require the httpx package - install with: pip install bcr-api[async]"
+            )
+        # A client's keep-alive connections are bound to the loop it was
+        # created under, so a client cached from a previous asyncio.run would
+        # fail with "Event loop is closed" - build a fresh one per loop.
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or (
+            self._aclient_loop is not None and self._aclient_loop is not loop
+        ):
+            client_kwargs = dict(
+                base_url=self.apiurl,
+                headers={"Authorization": "Bearer {}".format(self.token)},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30.0,
+            )
+            try:
+                # HTTP/2 multiplexes concurrent calls over a single TLS
+                # connection; it needs the optional h2 package, installed as
+                # part of the bcr-api[async] extra.
+                self._aclient = httpx.AsyncClient(http2=True, **client_kwargs)
+            except ImportError:
+                self._aclient = httpx.AsyncClient(**client_kwargs)
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def arequest(self, verb, address, params=None, data=None):
+        """
+        Makes an asynchronous request to the Brandwatch API.  Multiple calls can be overlapped with asyncio.gather (or the gather helper below) so that independent requests share one round-trip rather than running serially.
+        Concurrent identical GETs are collapsed into a single request whose response all callers share.
+
+        Args:
+            verb:       HTTP method for the request (e.g. 'GET').
+            address:    Address to append to the Brandwatch API url.
+            params:     Any additional parameters - Optional.
+            data:       Any additional data - Optional.
+
+        Returns:
+            The response json
+        """
+        if verb != "GET":
+            return await self._arequest(verb, address, params, data)
+
+        key = (
+            address,
+            tuple(
+                sorted(
+                    (name, tuple(value) if isinstance(value, list) else value)
+                    for name, value in (params or {}).items()
+                )
+            ),
+        )
+        if key in self._inflight:
+            return await self._inflight[key]
+        task = asyncio.ensure_future(self._arequest(verb, address, params, data))
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _arequest(self, verb, address, params, data):
+        client = self._async_client()
+        headers = {"Content-type": "application/json"} if data else {}
+        response = await client.request(
+            verb, address, params=params, content=data, headers=headers
+        )
+
+        try:
+            body = response.json()
+        except ValueError:
+            logger.error(
+                "There was an error with this request: \n{}\n{}\n{}".format(
+                    response.url, data, response.text
+                )
+            )
+            response.raise_for_status()
+            raise RuntimeError(response.text)
+
+        if "errors" in body and body["errors"]:
+            logger.error(
+                "There was an error with this request: \n{}\n{}\n{}".format(
+                    response.url, data, body["errors"]
                 )
-                raise RuntimeError(response.json()["errors"])
+            )
+            raise RuntimeError(body["errors"])
+
+        logger.debug("%s", response.url)
+        return body
+
+    async def aget(self, address, params=None):
+        """ Asynchronous GET request - see arequest. """
+        return await self.arequest("GET", address, params=params)
+
+    async def apost(self, address, params=None, data=None):
+        """ Asynchronous POST request - see arequest. """
+        return await self.arequest("POST", address, params=params, data=data)
+
+    async def aput(self, address, params=None, data=None):
+        """ Asynchronous PUT request - see arequest. """
+        return await self.arequest("PUT", address, params=params, data=data)
+
+    async def apatch(self, address, params=None, data=None):
+        """ Asynchronous PATCH request - see arequest. """
+        return await self.arequest("PATCH", address, params=params, data=data)
+
+    async def adelete(self, address, params=None):
+        """ Asynchronous DELETE request - see arequest. """
+        return await self.arequest("DELETE", address, params=params)
+
+    async def avalidate_queries(self, queries, language=("en",)):
+        """
+        Validates several query searches concurrently - the async, bulk counterpart of validate_query_search.
+
+        Args:
+            queries:    Iterable of search strings to validate.
+            language:   Languages in which you'd like to test the queries - Optional.
+
+        Returns:
+            List of validation results, in the same order as the queries.
+
+        Raises:
+            RuntimeError: If any of the searches has errors in it.
+        """
+        payloads = [
+            {"booleanQuery": query, "language": list(language)} for query in queries
+        ]
+        results = await self.gather(
+            ("POST", "query-validation", None, json.dumps(payload))
+            for payload in payloads
+        )
+        # Feed the memo used by validate_query_search so mixed sync/bulk usage shares results
+        for payload, result in zip(payloads, results):
+            key = ("query-validation", json.dumps(payload, sort_keys=True))
+            self._validation_cache[key] = result
+        return results
+
+    def validate_queries(self, queries, language=("en",)):
+        """
+        Validates several query searches concurrently, blocking until all results are in.  See avalidate_queries.
+        """
+
+        async def run():
+            try:
+                return await self.avalidate_queries(queries, language=language)
+            finally:
+                # The event loop dies with asyncio.run, so close the client's
+                # connections while the loop can still do it cleanly.
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def gather(self, calls):
+        """
+        Runs several API calls concurrently.
+
+        Args:
+            calls:  Iterable of argument tuples, each of which is passed to arequest (e.g. [('GET', 'projects'), ('GET', 'me')]).
+
+        Returns:
+            List of response jsons, in the same order as the calls.
+        """
+        return await asyncio.gather(*(self.arequest(*call) for call in calls))
 
-        logger.debug(response.url)
-        return response.json()
+    async def aclose(self):
+        """ Closes the shared async client, if one was created. """
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
 
 
 class BWProject(BWUser):
@@ -255,7 +563,7 @@ class BWProject(BWUser):
 
     def __init__(
         self,
-        project,
+        project=None,
         token=None,
         token_path="tokens.txt",
         username=None,
@@ -264,16 +572,24 @@ class BWProject(BWUser):
         client_id="brandwatch-api-client",
         client_secret=None,
         apiurl="https://api.brandwatch.com/",
+        cache_responses=False,
+        project_cache_path=DEFAULT_PROJECT_CACHE_PATH,
+        project_id=None,
     ):
         """
         Creates a BWProject object - inheriting directly from the BWUser class.
 
         Args:
             username:       Brandwatch username.
-            project:        Brandwatch project name.
+            project:        Brandwatch project name - Optional if you pass project_id instead.
             password:       Brandwatch password - Optional if you already have an access token.
             token:          Access token - Optional.
             token_path:     File path to the file where access tokens will be read from and written to - Optional.
+            project_cache_path: File path to the file where project name to id mappings are cached, so that repeat runs can skip the projects listing call - Optional.  Pass None to disable, or delete the file to clear stale entries.
+            project_id:     Brandwatch project id - Optional.  When passed, the project is used directly and no projects listing call is made at all.
+
+        Raises:
+            KeyError: If neither project nor project_id is passed.
         """
         super().__init__(
             token=token,
@@ -284,47 +600,83 @@ class BWProject(BWUser):
             client_id=client_id,
             client_secret=client_secret,
             apiurl=apiurl,
+            cache_responses=cache_responses,
         )
         self.project_name = ""
         self.project_id = -1
         self.project_address = ""
-        self.get_project(project)
+        self._project_cache_path = project_cache_path
+        if project_id is not None:
+            p = self._cached_project(project_id)
+            if p is not None:
+                self.project_name = p["name"]
+            self.project_id = project_id
+            self.project_address = "projects/" + str(project_id) + "/"
+        elif project is not None:
+            self.get_project(project)
+        else:
+            raise KeyError("Must provide a project name or a project_id")
 
     def get_project(self, project):
         """
         Returns a dictionary of the project information (name, id, clientName, timezone, ....).
 
         Args:
-            project:    Brandwatch project.
+            project:    Brandwatch project name or id.
         """
-        projects = self.get_projects()
-        project_found = False
-
+        p = self._cached_project(project)
+        if p is None:
+            projects = self.get_projects()
+            # Keyed by name and by id (as a string), with id taking precedence on collision
+            by_key = {}
+            for proj in projects:
+                by_key[proj["name"]] = proj
+            for proj in projects:
+                by_key[str(proj["id"])] = proj
+            p = by_key.get(str(project))
+            if p is None:
+                raise KeyError("Project " + str(project) + " not found")
+            self._store_project_cache(projects)
+
+        self.project_name = p["name"]
+        self.project_id = p["id"]
+        self.project_address = "projects/" + str(self.project_id) + "/"
+
+    def _cached_project(self, project):
+        """ Looks up the project in the on-disk cache, returning None on a miss. """
+        if self._project_cache_path is None:
+            return None
         try:
-            int(project)
-            numerical = True
-        except ValueError:
-            numerical = False
-
+            with open(self._project_cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        return cache.get(self.username.lower(), {}).get(str(project))
+
+    def _store_project_cache(self, projects):
+        """ Writes this user's project name/id mappings back to the on-disk cache atomically. """
+        if self._project_cache_path is None:
+            return
+        try:
+            with open(self._project_cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+        entries = {}
         for p in projects:
-            found = False
-            if numerical:
-                if p["id"] == int(project):
-                    found = True
-            else:
-                if p["name"] == project:
-                    found = True
-            if found:
-                self.project_name = p["name"]
-                self.project_id = p["id"]
-                self.project_address = "projects/" + str(self.project_id) + "/"
-                project_found = True
-                break
-
-        if not project_found:
-            raise KeyError("Project " + str(project) + " not found")
-
-    def get(self, endpoint, params={}):
+            entry = {"id": p["id"], "name": p["name"]}
+            entries[p["name"]] = entry
+            entries[str(p["id"])] = entry
+        cache[self.username.lower()] = entries
+        cache_dir = os.path.dirname(self._project_cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        temp_path = self._project_cache_path + ".tmp"
+        with open(temp_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(temp_path, self._project_cache_path)
+
+    def get(self, endpoint, params=None):
         """
         Makes a project level GET request
 
@@ -336,10 +688,10 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.get, address=self.project_address + endpoint, params=params
+            verb="GET", address=self.project_address + endpoint, params=params
         )
 
-    def delete(self, endpoint, params={}):
+    def delete(self, endpoint, params=None):
         """
         Makes a project level DELETE request
 
@@ -351,10 +703,10 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.delete, address=self.project_address + endpoint, params=params
+            verb="DELETE", address=self.project_address + endpoint, params=params
         )
 
-    def post(self, endpoint, params={}, data={}):
+    def post(self, endpoint, params=None, data=None):
         """
         Makes a project level POST request
 
@@ -367,13 +719,13 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.post,
+            verb="POST",
             address=self.project_address + endpoint,
             params=params,
             data=data,
         )
 
-    def put(self, endpoint, params={}, data={}):
+    def put(self, endpoint, params=None, data=None):
         """
         Makes a project level PUT request
 
@@ -386,13 +738,13 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.put,
+            verb="PUT",
             address=self.project_address + endpoint,
             params=params,
             data=data,
         )
 
-    def patch(self, endpoint, params={}, data={}):
+    def patch(self, endpoint, params=None, data=None):
         """
         Makes a project level PATCH request
 
@@ -405,7 +757,7 @@ class BWProject(BWUser):
             Server's response to the HTTP request.
         """
         return self.request(
-            verb=requests.patch,
+            verb="PATCH",
             address=self.project_address + endpoint,
             params=params,
             data=data,
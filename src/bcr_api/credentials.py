@@ -3,6 +3,7 @@
 credentials contains the CredentialsStore class, which responsible for persisting access tokens to disk.
 """
 
+import json
 import logging
 import os
 from pathlib import Path
@@ -17,6 +18,10 @@ class CredentialsStore:
     CredentialsStore is responsible for persisting access tokens to disk.
     """
 
+    # Parsed credentials keyed by file path, each entry holding (mtime_ns, credentials)
+    # so repeated reads of an unchanged file skip the disk round-trip.
+    _cache = {}
+
     def __init__(self, credentials_path=None):
         """
         Create a new CredentialsStore
@@ -65,24 +70,57 @@ class CredentialsStore:
     def __len__(self):
         return len(self._read())
 
+    def _cache_key(self):
+        return os.path.abspath(str(self._credentials_path))
+
     def _write(self, credentials):
         self._ensure_file_exists()
-        with open(str(self._credentials_path), "w") as token_file:
-            contents = "\n".join(["\t".join(item) for item in credentials.items()])
-            token_file.write(contents)
+        path = str(self._credentials_path)
+        # Write to a sibling temp file and rename into place so a crash or
+        # concurrent reader never sees a partially written store.
+        temp_path = path + ".tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as token_file:
+            json.dump(credentials, token_file, indent=2)
+        os.replace(temp_path, path)
+        CredentialsStore._cache[self._cache_key()] = (
+            os.stat(path).st_mtime_ns,
+            dict(credentials),
+        )
 
     def _read(self):
         self._ensure_file_exists()
-        with open(str(self._credentials_path)) as token_file:
-            credentials = dict()
-            for line in token_file:
-                try:
-                    user, token = line.split()
-                except ValueError:
-                    logger.warning('Ignoring corrupted credentials line: "%s"', line)
-                    pass
-                credentials[user.lower()] = token
-            return credentials
+        path = str(self._credentials_path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = CredentialsStore._cache.get(self._cache_key())
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+        with open(path) as token_file:
+            contents = token_file.read()
+        try:
+            credentials = {
+                user.lower(): token for user, token in json.loads(contents).items()
+            }
+        except ValueError:
+            # Stores written before the switch to JSON hold one
+            # tab-separated user/token pair per line.
+            credentials = self._parse_legacy(contents)
+        CredentialsStore._cache[self._cache_key()] = (mtime_ns, dict(credentials))
+        return credentials
+
+    @staticmethod
+    def _parse_legacy(contents):
+        credentials = dict()
+        for line in contents.splitlines():
+            if not line.strip():
+                continue
+            try:
+                user, token = line.split()
+            except ValueError:
+                logger.warning('Ignoring corrupted credentials line: "%s"', line)
+                continue
+            credentials[user.lower()] = token
+        return credentials
 
     def _ensure_file_exists(self):
         self._ensure_dir_exists()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from bcr_api.bwproject import BWUser
+from bcr_api.credentials import CredentialsStore
+
+USERNAME = "example@example.com"
+ACCESS_TOKEN = "00000000-0000-0000-0000-000000000000"
+
+
+@unittest.skipIf(httpx is None, "requires the optional httpx package")
+class TestAsyncRequests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        token_path = Path(self.temp_dir.name) / "tokens.txt"
+        CredentialsStore(credentials_path=token_path)[USERNAME] = ACCESS_TOKEN
+        self.user = BWUser(username=USERNAME, token_path=token_path)
+
+    def tearDown(self):
+        asyncio.run(self.user.aclose())
+        self.temp_dir.cleanup()
+
+    def _mount(self, handler):
+        """Replace the lazily created async client with one backed by a mock transport"""
+        self.user._aclient = httpx.AsyncClient(
+            base_url=self.user.apiurl, transport=httpx.MockTransport(handler)
+        )
+
+    def test_aget(self):
+        def handler(request):
+            return httpx.Response(200, json={"results": [{"id": 1}]})
+
+        self._mount(handler)
+        body = asyncio.run(self.user.aget("projects"))
+        self.assertEqual(body["results"][0]["id"], 1)
+
+    def test_gather_preserves_order(self):
+        def handler(request):
+            return httpx.Response(200, json={"path": request.url.path})
+
+        self._mount(handler)
+        results = asyncio.run(self.user.gather([("GET", "projects"), ("GET", "me")]))
+        self.assertEqual([r["path"] for r in results], ["/projects", "/me"])
+
+    def test_validate_queries(self):
+        def handler(request):
+            payload = json.loads(request.content.decode("utf-8"))
+            return httpx.Response(200, json={"query": payload["booleanQuery"]})
+
+        self._mount(handler)
+        results = self.user.validate_queries(["cats", "dogs"])
+        self.assertEqual([r["query"] for r in results], ["cats", "dogs"])
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"ok": True})
+
+        self._mount(handler)
+        results = asyncio.run(self.user.gather([("GET", "projects")] * 3))
+        self.assertEqual(results, [{"ok": True}] * 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_client_recreated_for_each_event_loop(self):
+        async def grab_client():
+            return self.user._async_client()
+
+        first = asyncio.run(grab_client())
+        second = asyncio.run(grab_client())
+
+        # Each asyncio.run closes its loop, so reusing the first client would
+        # fail with "Event loop is closed" on any real connection.
+        self.assertIsNot(first, second)
+
+    def test_error_response_raises(self):
+        def handler(request):
+            return httpx.Response(400, json={"errors": ["bad request"]})
+
+        self._mount(handler)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.user.aget("projects"))
+
+
+if __name__ == "__main__":
+    unittest.main()
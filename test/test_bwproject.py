@@ -1,9 +1,12 @@
 import unittest
+import requests
 import responses
 import os
 import tempfile
+from pathlib import Path
 
-from bcr_api.bwproject import BWProject
+from bcr_api.bwproject import BWProject, BWUser
+from bcr_api.credentials import CredentialsStore
 
 
 class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
@@ -24,7 +27,11 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
     ]
 
     def setUp(self):
+        BWUser._projects_cache.clear()
         self.token_path = tempfile.NamedTemporaryFile(suffix="-tokens.txt").name
+        self.project_cache_path = tempfile.NamedTemporaryFile(
+            suffix="-projects.json"
+        ).name
 
         responses.add(
             responses.GET,
@@ -47,6 +54,8 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
 
     def tearDown(self):
         os.unlink(self.token_path)
+        if os.path.exists(self.project_cache_path):
+            os.unlink(self.project_cache_path)
         responses.reset()
 
     @responses.activate
@@ -75,14 +84,135 @@ class TestBWProjectUsernameCaseSensitivity(unittest.TestCase):
             project=self.PROJECT_NAME,
             password="",
             token_path=self.token_path,
+            project_cache_path=self.project_cache_path,
         )
         try:
             BWProject(
-                username=username, project=self.PROJECT_NAME, token_path=self.token_path
+                username=username,
+                project=self.PROJECT_NAME,
+                token_path=self.token_path,
+                project_cache_path=self.project_cache_path,
             )
         except KeyError as e:
             self.fail(e)
 
+    @responses.activate
+    def test_get_projects_memoized(self):
+        responses.add(
+            responses.GET,
+            "https://api.brandwatch.com/me",
+            json={"username": self.USERNAME},
+            status=200,
+        )
+        project = BWProject(
+            username=self.USERNAME,
+            project=self.PROJECT_NAME,
+            password="",
+            token_path=self.token_path,
+            project_cache_path=self.project_cache_path,
+        )
+
+        project.get_projects()
+        project.get_projects()
+        self.assertEqual(self._count_projects_calls(), 1)
+
+        project.get_projects(refresh=True)
+        self.assertEqual(self._count_projects_calls(), 2)
+
+    def _count_projects_calls(self):
+        return len(
+            [
+                call
+                for call in responses.calls
+                if call.request.url.startswith("https://api.brandwatch.com/projects")
+            ]
+        )
+
+    @responses.activate
+    def test_project_id_skips_projects_call(self):
+        project = BWProject(
+            username=self.USERNAME,
+            password="",
+            project_id=42,
+            token_path=self.token_path,
+            project_cache_path=self.project_cache_path,
+        )
+
+        self.assertEqual(project.project_id, 42)
+        self.assertEqual(project.project_address, "projects/42/")
+        self.assertEqual(self._count_projects_calls(), 0)
+
+    @responses.activate
+    def test_cached_project_lookup_skips_projects_call(self):
+        BWProject(
+            username=self.USERNAME,
+            project=self.PROJECT_NAME,
+            password="",
+            token_path=self.token_path,
+            project_cache_path=self.project_cache_path,
+        )
+
+        # Clear the in-memory listing so the second construction can only be
+        # served by the on-disk project cache.
+        BWUser._projects_cache.clear()
+        BWProject(
+            username=self.USERNAME,
+            project=self.PROJECT_NAME,
+            token_path=self.token_path,
+            project_cache_path=self.project_cache_path,
+        )
+
+        self.assertEqual(self._count_projects_calls(), 1)
+
+
+class TestBareRequestRetries(unittest.TestCase):
+
+    USERNAME = "example@example.com"
+    ACCESS_TOKEN = "00000000-0000-0000-0000-000000000000"
+    PROJECTS_URL = "https://api.brandwatch.com/projects"
+
+    def setUp(self):
+        BWUser._projects_cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        token_path = Path(self.temp_dir.name) / "tokens.txt"
+        CredentialsStore(credentials_path=token_path)[self.USERNAME] = self.ACCESS_TOKEN
+        self.user = BWUser(username=self.USERNAME, token_path=token_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        responses.reset()
+
+    def _add_rate_limited_response(self):
+        responses.add(
+            responses.GET,
+            self.PROJECTS_URL,
+            json={"error": "rate limited"},
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+
+    @responses.activate
+    def test_retries_after_429_and_returns_body(self):
+        self._add_rate_limited_response()
+        responses.add(
+            responses.GET, self.PROJECTS_URL, json={"results": []}, status=200
+        )
+
+        body = self.user.request(verb="GET", address="projects")
+
+        self.assertEqual(body, {"results": []})
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_exhausted_429_retries_raise(self):
+        for _ in range(5):
+            self._add_rate_limited_response()
+
+        with self.assertRaises(requests.HTTPError):
+            self.user.request(verb="GET", address="projects")
+
+        self.assertEqual(len(responses.calls), 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 # coding=utf-8
+import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -100,6 +102,35 @@ class TestCredentialsStore(unittest.TestCase):
         store["eXaMpLe@ExAmPlE.cOm"] = ACCESS_TOKEN
         self.assertEqual(store["example@example.com"], ACCESS_TOKEN)
 
+    @with_credential_store
+    def test_store_written_as_json(self, store):
+        store["example@example.com"] = ACCESS_TOKEN
+
+        with open(str(store._credentials_path)) as token_file:
+            self.assertEqual(
+                json.load(token_file), {"example@example.com": ACCESS_TOKEN}
+            )
+
+    @with_credential_store
+    def test_reads_legacy_tab_separated_store(self, store):
+        with open(str(store._credentials_path), "w") as token_file:
+            token_file.write("example@example.com\t{}".format(ACCESS_TOKEN))
+
+        self.assertEqual(store["example@example.com"], ACCESS_TOKEN)
+
+    @with_credential_store
+    def test_read_cache_invalidated_by_external_write(self, store):
+        store["example@example.com"] = ACCESS_TOKEN
+
+        new_token = "10000000-0000-0000-0000-000000000000"
+        path = str(store._credentials_path)
+        with open(path, "w") as token_file:
+            token_file.write("example@example.com\t{}".format(new_token))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        self.assertEqual(store["example@example.com"], new_token)
+
     @with_credential_store
     def test_get_lower(self, store):
         store["example@example.com"] = ACCESS_TOKEN
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+
+import responses
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+from bcr_api.bwproject import BWUser
+
+API_URL = "https://api.brandwatch.com/me"
+
+
+@unittest.skipIf(requests_cache is None, "requires the optional requests-cache package")
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        responses.reset()
+
+    def _session(self, token):
+        return BWUser._build_session(True, token=token, cache_dir=self.temp_dir.name)
+
+    @responses.activate
+    def test_repeat_gets_served_from_cache(self):
+        responses.add(responses.GET, API_URL, json={"username": "first"}, status=200)
+
+        session = self._session("token-one")
+        try:
+            self.assertEqual(session.get(API_URL).json(), {"username": "first"})
+            self.assertEqual(session.get(API_URL).json(), {"username": "first"})
+        finally:
+            session.close()
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_accounts_do_not_share_cached_responses(self):
+        responses.add(responses.GET, API_URL, json={"username": "first"}, status=200)
+        responses.add(responses.GET, API_URL, json={"username": "second"}, status=200)
+
+        first = self._session("token-one")
+        second = self._session("token-two")
+        try:
+            self.assertEqual(first.get(API_URL).json(), {"username": "first"})
+            self.assertEqual(second.get(API_URL).json(), {"username": "second"})
+        finally:
+            first.close()
+            second.close()
+
+        self.assertEqual(len(responses.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()